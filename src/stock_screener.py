@@ -2,9 +2,16 @@
 Stock Screener - Find low-value, recession-proof stocks with long-term trends
 """
 
-import yfinance as yf
+import functools
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+
 import pandas as pd
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 
 
@@ -101,119 +108,401 @@ SECTORS = {
     ],
 }
 
+# Deduplicated, sorted symbols per category and across all categories.
+# Stable ordering keeps batched downloads and cache usage consistent between runs.
+SECTOR_SYMBOLS = {category: tuple(sorted(set(syms))) for category, syms in SECTORS.items()}
+ALL_SYMBOLS = tuple(sorted({sym for syms in SECTORS.values() for sym in syms}))
+
+# Reverse index of symbol -> categories it belongs to
+_symbol_categories = {}
+for _category, _syms in SECTORS.items():
+    for _sym in _syms:
+        _symbol_categories.setdefault(_sym, set()).add(_category)
+SYMBOL_CATEGORIES = {sym: frozenset(cats) for sym, cats in _symbol_categories.items()}
+del _symbol_categories, _category, _syms, _sym
+
+# Fields returned by get_stock_data
+INFO_TEXT_FIELDS = ("name", "sector")
+INFO_NUMERIC_FIELDS = (
+    "pe_ratio", "forward_pe", "pb_ratio", "dividend_yield", "market_cap",
+    "beta", "avg_volume",
+)
+
+# Number of concurrent Yahoo Finance requests when screening
+MAX_WORKERS = 10
+
+# On-disk cache for fetched stock data
+CACHE_DIR = Path(__file__).resolve().parent.parent / ".cache"
+CACHE_DB = CACHE_DIR / "stocks.db"
+FUNDAMENTALS_TTL = 24 * 60 * 60  # seconds
+DEAD_SYMBOL_TTL = 7 * 24 * 60 * 60  # seconds
+HISTORY_PERIOD = "2y"
+
+
+@functools.cache
+def _yf():
+    """Import yfinance on first use so the menu starts without loading it."""
+    import yfinance
+    # Make failed requests raise instead of returning empty data, so they are
+    # never mistaken for delisted symbols (older yfinance has no config)
+    if hasattr(yfinance, "config"):
+        yfinance.config.debug.hide_exceptions = False
+    return yfinance
+
+
+def _write(message: str):
+    """Print a message from a worker without garbling the progress bar."""
+    from tqdm import tqdm
+    tqdm.write(message)
+
+
+_local = threading.local()
+
+
+def _cache_connection() -> sqlite3.Connection:
+    """Return this thread's connection to the SQLite cache, creating it if needed."""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(CACHE_DB, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            " symbol TEXT NOT NULL,"
+            " kind TEXT NOT NULL,"
+            " fetched_at REAL NOT NULL,"
+            " payload BLOB NOT NULL,"
+            " PRIMARY KEY (symbol, kind))"
+        )
+        _local.conn = conn
+    return conn
+
+
+def _load_cached(symbol: str, kind: str, ttl: float) -> dict | None:
+    """Load cached data if present and not older than ttl seconds."""
+    try:
+        row = _cache_connection().execute(
+            "SELECT payload FROM cache WHERE symbol = ? AND kind = ? AND fetched_at > ?",
+            (symbol, kind, time.time() - ttl),
+        ).fetchone()
+    except (OSError, sqlite3.Error):
+        return None
+    if row is None:
+        return None
+    try:
+        return json.loads(row[0])
+    except ValueError:
+        return None
+
 
-def get_stock_data(symbol: str) -> dict | None:
-    """Fetch stock data and key metrics."""
+def _save_cached(symbol: str, kind: str, data: dict):
+    """Write data to the SQLite cache."""
+    try:
+        _cache_connection().execute(
+            "INSERT OR REPLACE INTO cache (symbol, kind, fetched_at, payload) VALUES (?, ?, ?, ?)",
+            (symbol, kind, time.time(), json.dumps(data).encode()),
+        )
+    except (OSError, sqlite3.Error) as e:
+        _write(f"Error caching {symbol}: {e}")
+
+
+def _known_dead_symbols() -> set[str]:
+    """Return symbols recently found to be delisted or invalid."""
+    try:
+        rows = _cache_connection().execute(
+            "SELECT symbol FROM cache WHERE kind = 'dead' AND fetched_at > ?",
+            (time.time() - DEAD_SYMBOL_TTL,),
+        ).fetchall()
+    except (OSError, sqlite3.Error):
+        return set()
+    return {row[0] for row in rows}
+
+
+def clear_dead_symbols():
+    """Forget all symbols marked as delisted or invalid so they are screened again."""
+    try:
+        _cache_connection().execute("DELETE FROM cache WHERE kind = 'dead'")
+    except (OSError, sqlite3.Error) as e:
+        print(f"Error clearing dead symbols: {e}")
+
+
+def _cached_fetch(symbol: str, kind: str, ttl: float, fetch) -> dict | None:
+    """Return cached data for a symbol, calling fetch(symbol) on a miss."""
+    data = _load_cached(symbol, kind, ttl)
+    if data is None:
+        data = fetch(symbol)
+        if data is not None:
+            _save_cached(symbol, kind, data)
+    return data
+
+
+def _fetch_fundamentals(symbol: str) -> dict | None:
+    """Fetch the fundamentals used for scoring from Yahoo Finance."""
+    yf = _yf()
     try:
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
-
-        # Get historical data for trend analysis (2 years)
-        hist = ticker.history(period="2y")
-        if hist.empty:
-            return None
-
-        # Calculate trend metrics
-        current_price = hist["Close"].iloc[-1]
-        price_1y_ago = hist["Close"].iloc[len(hist)//2] if len(hist) > 250 else hist["Close"].iloc[0]
-        price_2y_ago = hist["Close"].iloc[0]
-
-        return {
-            "symbol": symbol,
-            "name": info.get("shortName", symbol),
-            "sector": info.get("sector", "Unknown"),
-            "price": current_price,
-            "pe_ratio": info.get("trailingPE"),
-            "forward_pe": info.get("forwardPE"),
-            "pb_ratio": info.get("priceToBook"),
-            "dividend_yield": info.get("dividendYield", 0) or 0,
-            "market_cap": info.get("marketCap", 0),
-            "beta": info.get("beta"),
-            "52w_high": info.get("fiftyTwoWeekHigh"),
-            "52w_low": info.get("fiftyTwoWeekLow"),
-            "1y_return": ((current_price - price_1y_ago) / price_1y_ago) * 100,
-            "2y_return": ((current_price - price_2y_ago) / price_2y_ago) * 100,
-            "avg_volume": info.get("averageVolume", 0),
-        }
+        info = yf.Ticker(symbol).info
     except Exception as e:
-        print(f"Error fetching {symbol}: {e}")
+        # Yahoo answers 404 for unknown symbols; any other failure may be transient
+        if getattr(getattr(e, "response", None), "status_code", None) == 404:
+            _save_cached(symbol, "dead", {})
+        _write(f"Error fetching {symbol}: {e}")
+        return None
+
+    # Delisted or renamed symbols come back without a symbol field. Only trust
+    # that when yfinance raises on failed requests rather than hiding them.
+    if not info or "symbol" not in info:
+        if hasattr(yf, "config"):
+            _save_cached(symbol, "dead", {})
+        return None
+
+    return {
+        "name": info.get("shortName", symbol),
+        "sector": info.get("sector", "Unknown"),
+        "pe_ratio": info.get("trailingPE"),
+        "forward_pe": info.get("forwardPE"),
+        "pb_ratio": info.get("priceToBook"),
+        "dividend_yield": info.get("dividendYield", 0) or 0,
+        "market_cap": info.get("marketCap", 0),
+        "beta": info.get("beta"),
+        "avg_volume": info.get("averageVolume", 0),
+    }
+
+
+def download_history(symbols: list[str]) -> pd.DataFrame:
+    """Download price history for all symbols in a single batched request."""
+    return _yf().download(
+        symbols,
+        period=HISTORY_PERIOD,
+        group_by="ticker",
+        threads=True,
+        progress=False,
+    )
+
+
+def get_close_prices(history: pd.DataFrame, symbols: list[str]) -> pd.DataFrame:
+    """Extract a (days x symbols) frame of closing prices from a batched download."""
+    if history.empty:
+        return pd.DataFrame(columns=symbols, dtype=float)
+    if not isinstance(history.columns, pd.MultiIndex):
+        # Older yfinance returns flat columns for a single symbol
+        return history[["Close"]].set_axis(symbols[:1], axis=1)
+    return history.xs("Close", axis=1, level=1).reindex(columns=symbols)
+
+
+def calculate_returns(close: pd.DataFrame) -> pd.DataFrame:
+    """Calculate current price, 52-week range and 1y/2y returns for every symbol at once."""
+    if close.empty:
+        return pd.DataFrame(columns=["price", "52w_high", "52w_low", "1y_return", "2y_return"], dtype=float)
+
+    valid = close.notna().to_numpy()
+    prices = close.ffill().to_numpy(dtype=float)
+    counts = valid.sum(axis=0)
+    cols = np.arange(prices.shape[1])
+
+    # Each symbol's history starts at its first valid row; 1y ago is its midpoint
+    first = valid.argmax(axis=0)
+    mid = np.where(counts > 250, first + counts // 2, first)
+
+    current_price = prices[-1]
+    price_1y_ago = prices[mid, cols]
+    price_2y_ago = prices[first, cols]
+
+    last_year = close.iloc[-252:]
+
+    metrics = pd.DataFrame({
+        "price": current_price,
+        "52w_high": last_year.max().to_numpy(),
+        "52w_low": last_year.min().to_numpy(),
+        "1y_return": (current_price - price_1y_ago) / price_1y_ago * 100,
+        "2y_return": (current_price - price_2y_ago) / price_2y_ago * 100,
+    }, index=close.columns)
+    return metrics[counts > 0]
+
+
+def get_stock_data(symbol: str) -> dict | None:
+    """Fetch a symbol's fundamentals, using the on-disk cache when fresh."""
+    return _cached_fetch(symbol, "fundamentals", FUNDAMENTALS_TTL, _fetch_fundamentals)
+
+
+def _to_float(value) -> float:
+    """Convert a fetched value to float, mapping None and non-numeric values to NaN."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def fetch_info_columns(symbols: list[str]) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """
+    Fetch fundamentals for all symbols concurrently into column arrays.
+
+    Each worker writes its symbol's values into that symbol's slot of
+    preallocated arrays, so no per-symbol records are accumulated.
+
+    Returns:
+        Boolean mask of symbols fetched successfully, and a dict of field -> array
+    """
+    n = len(symbols)
+    found = np.zeros(n, dtype=bool)
+    columns = {field: np.empty(n, dtype=object) for field in INFO_TEXT_FIELDS}
+    columns.update({field: np.full(n, np.nan) for field in INFO_NUMERIC_FIELDS})
+
+    def fetch(i: int):
+        info = get_stock_data(symbols[i])
+        if info is None:
+            return
+        for field in INFO_TEXT_FIELDS:
+            columns[field][i] = info.get(field)
+        for field in INFO_NUMERIC_FIELDS:
+            columns[field][i] = _to_float(info.get(field))
+        found[i] = True
+
+    from tqdm import tqdm
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = [executor.submit(fetch, i) for i in range(n)]
+        for future in tqdm(as_completed(futures), total=n, desc="Analyzing", leave=False):
+            future.result()
+
+    return found, columns
+
+
+# Scoring tables: bin edges and the points awarded for each bucket.
+# Lower-is-better metrics bucket with x < edge, higher-is-better with x > edge.
+PE_BINS, PE_POINTS = np.array([15, 20, 25]), np.array([3, 2, 1, 0])
+PB_BINS, PB_POINTS = np.array([1.5, 3, 5]), np.array([3, 2, 1, 0])
+DIV_BINS, DIV_POINTS = np.array([0.01, 0.02, 0.04]), np.array([0, 1, 2, 3])
+BETA_BINS, BETA_POINTS = np.array([0.8, 1.0, 1.2]), np.array([3, 2, 1, 0])
+RET_1Y_BINS, RET_1Y_POINTS = np.array([0, 10, 20]), np.array([0, 1, 2, 3])
+RET_1Y_PENALTY_BELOW, RET_1Y_PENALTY = -20, -2  # strictly below, so not a bin edge
+RET_2Y_BINS, RET_2Y_POINTS = np.array([0, 15, 30]), np.array([0, 1, 2, 3])
+
+
+def _column(df: pd.DataFrame, name: str) -> np.ndarray:
+    """Return a column as floats, with None and non-numeric values as NaN."""
+    return pd.to_numeric(df[name], errors="coerce").to_numpy(dtype=float)
+
+
+def _points(values: np.ndarray, bins: np.ndarray, points: np.ndarray, right: bool = False) -> np.ndarray:
+    """Look up the points for each value's bucket."""
+    return points[np.digitize(values, bins, right=right)]
+
+
+def _value_inputs(df: pd.DataFrame) -> tuple[np.ndarray, ...]:
+    """Return P/E, P/B, dividend yield and beta arrays prepared for bucketing."""
+    pe = _column(df, "pe_ratio")
+    pb = _column(df, "pb_ratio")
+    div_yield = _column(df, "dividend_yield")
+    beta = _column(df, "beta")
+
+    # Missing or non-positive ratios and a missing/zero beta score nothing
+    pe = np.where(pe > 0, pe, np.inf)
+    pb = np.where(pb > 0, pb, np.inf)
+    beta = np.where(np.isnan(beta) | (beta == 0), np.inf, beta)
+    div_yield = np.nan_to_num(div_yield, nan=0.0)
+    return pe, pb, div_yield, beta
+
+
+def _trend_inputs(df: pd.DataFrame) -> tuple[np.ndarray, ...]:
+    """Return 1y and 2y return arrays prepared for bucketing."""
+    ret_1y = np.nan_to_num(_column(df, "1y_return"), nan=0.0)
+    ret_2y = np.nan_to_num(_column(df, "2y_return"), nan=0.0)
+    return ret_1y, ret_2y
+
+
+def calculate_value_scores(df: pd.DataFrame) -> pd.Series:
+    """Calculate value scores for every row (higher = better value)."""
+    pe, pb, div_yield, beta = _value_inputs(df)
+
+    score = (
+        _points(pe, PE_BINS, PE_POINTS)
+        + _points(pb, PB_BINS, PB_POINTS)
+        + _points(div_yield, DIV_BINS, DIV_POINTS, right=True)
+        + _points(beta, BETA_BINS, BETA_POINTS)
+    )
+    return pd.Series(score, index=df.index)
+
+
+def calculate_trend_scores(df: pd.DataFrame) -> pd.Series:
+    """Calculate trend scores for every row (positive = uptrend)."""
+    ret_1y, ret_2y = _trend_inputs(df)
+
+    score = (
+        _points(ret_1y, RET_1Y_BINS, RET_1Y_POINTS, right=True)
+        + np.where(ret_1y < RET_1Y_PENALTY_BELOW, RET_1Y_PENALTY, 0)
+        + _points(ret_2y, RET_2Y_BINS, RET_2Y_POINTS, right=True)
+    )
+    return pd.Series(score, index=df.index)
+
+
+@functools.cache
+def _score_kernel():
+    """Compile the Numba scoring kernel on first use, or return None without numba."""
+    try:
+        from numba import njit, prange
+    except ImportError:  # numba is optional; scoring falls back to NumPy
         return None
 
+    @njit(cache=True)
+    def points(x, bins, pts, right):
+        # Same bucket index as np.digitize(x, bins, right=right)
+        idx = 0
+        for edge in bins:
+            if x > edge or (not right and x == edge):
+                idx += 1
+        return pts[idx]
+
+    @njit(parallel=True, cache=True)
+    def kernel(pe, pb, div_yield, beta, ret_1y, ret_2y):
+        n = pe.size
+        value = np.zeros(n, dtype=np.int64)
+        trend = np.zeros(n, dtype=np.int64)
+        for i in prange(n):
+            value[i] = (
+                points(pe[i], PE_BINS, PE_POINTS, False)
+                + points(pb[i], PB_BINS, PB_POINTS, False)
+                + points(div_yield[i], DIV_BINS, DIV_POINTS, True)
+                + points(beta[i], BETA_BINS, BETA_POINTS, False)
+            )
+            trend[i] = (
+                points(ret_1y[i], RET_1Y_BINS, RET_1Y_POINTS, True)
+                + points(ret_2y[i], RET_2Y_BINS, RET_2Y_POINTS, True)
+            )
+            if ret_1y[i] < RET_1Y_PENALTY_BELOW:
+                trend[i] += RET_1Y_PENALTY
+        return value, trend
+
+    return kernel
+
+
+def calculate_scores(df: pd.DataFrame) -> tuple[pd.Series, pd.Series]:
+    """Calculate value and trend scores for every row, using Numba when available."""
+    kernel = _score_kernel()
+    if kernel is None:
+        return calculate_value_scores(df), calculate_trend_scores(df)
+
+    value, trend = kernel(*_value_inputs(df), *_trend_inputs(df))
+    return pd.Series(value, index=df.index), pd.Series(trend, index=df.index)
+
 
 def calculate_value_score(stock: dict) -> float:
-    """Calculate a value score (lower = better value)."""
-    score = 0
-
-    # P/E ratio scoring (lower is better)
-    pe = stock.get("pe_ratio")
-    if pe and pe > 0:
-        if pe < 15:
-            score += 3
-        elif pe < 20:
-            score += 2
-        elif pe < 25:
-            score += 1
-
-    # P/B ratio scoring (lower is better)
-    pb = stock.get("pb_ratio")
-    if pb and pb > 0:
-        if pb < 1.5:
-            score += 3
-        elif pb < 3:
-            score += 2
-        elif pb < 5:
-            score += 1
-
-    # Dividend yield scoring (higher is better for stability)
-    div_yield = stock.get("dividend_yield", 0)
-    if div_yield > 0.04:
-        score += 3
-    elif div_yield > 0.02:
-        score += 2
-    elif div_yield > 0.01:
-        score += 1
-
-    # Beta scoring (lower beta = more stable/recession-proof)
-    beta = stock.get("beta")
-    if beta:
-        if beta < 0.8:
-            score += 3
-        elif beta < 1.0:
-            score += 2
-        elif beta < 1.2:
-            score += 1
-
-    return score
+    """Calculate a value score for a single stock."""
+    row = pd.DataFrame([stock]).reindex(columns=["pe_ratio", "pb_ratio", "dividend_yield", "beta"])
+    return float(calculate_value_scores(row).iloc[0])
 
 
 def calculate_trend_score(stock: dict) -> float:
-    """Calculate trend score (positive = uptrend)."""
-    score = 0
-
-    # 1-year return
-    ret_1y = stock.get("1y_return", 0)
-    if ret_1y > 20:
-        score += 3
-    elif ret_1y > 10:
-        score += 2
-    elif ret_1y > 0:
-        score += 1
-    elif ret_1y < -20:
-        score -= 2
-
-    # 2-year return
-    ret_2y = stock.get("2y_return", 0)
-    if ret_2y > 30:
-        score += 3
-    elif ret_2y > 15:
-        score += 2
-    elif ret_2y > 0:
-        score += 1
-
-    return score
-
-
-def screen_stocks(category: str = None, min_value_score: int = 5, min_trend_score: int = 2) -> pd.DataFrame:
+    """Calculate trend score for a single stock."""
+    row = pd.DataFrame([stock]).reindex(columns=["1y_return", "2y_return"])
+    return float(calculate_trend_scores(row).iloc[0])
+
+
+def screen_stocks(
+    category: str = None,
+    min_value_score: int = 5,
+    min_trend_score: int = 2,
+    top_k: int = None,
+) -> pd.DataFrame:
     """
     Screen stocks based on category and scoring criteria.
 
@@ -222,41 +511,70 @@ def screen_stocks(category: str = None, min_value_score: int = 5, min_trend_scor
                  If None, screens all categories
         min_value_score: Minimum value score to include (default 5)
         min_trend_score: Minimum trend score to include (default 2)
+        top_k: Only return the top_k stocks by combined score.
+               If None, returns all qualifying stocks
 
     Returns:
         DataFrame of qualifying stocks sorted by combined score
     """
+    if top_k is not None and top_k < 0:
+        raise ValueError(f"top_k must be non-negative, got {top_k}")
+
     if category:
-        symbols = SECTORS.get(category, [])
+        symbols = list(SECTOR_SYMBOLS.get(category, ()))
         if not symbols:
             print(f"Unknown category: {category}")
             print(f"Available categories: {list(SECTORS.keys())}")
             return pd.DataFrame()
     else:
-        # Get all unique symbols from all categories
-        symbols = list(set(sym for syms in SECTORS.values() for sym in syms))
+        symbols = list(ALL_SYMBOLS)
+
+    # Skip symbols already known to be delisted or invalid
+    dead = _known_dead_symbols().intersection(symbols)
+    if dead:
+        print(f"Skipping {len(dead)} known delisted/invalid symbols: {', '.join(sorted(dead))}")
+        print("  (call clear_dead_symbols() to screen them again)")
+        symbols = [symbol for symbol in symbols if symbol not in dead]
+    if not symbols:
+        return pd.DataFrame()
 
     print(f"Screening {len(symbols)} stocks...")
 
-    results = []
-    for i, symbol in enumerate(symbols):
-        print(f"  [{i+1}/{len(symbols)}] Analyzing {symbol}...", end="\r")
-        data = get_stock_data(symbol)
-        if data:
-            data["value_score"] = calculate_value_score(data)
-            data["trend_score"] = calculate_trend_score(data)
-            data["combined_score"] = data["value_score"] + data["trend_score"]
-            results.append(data)
-
-    print(" " * 50, end="\r")  # Clear progress line
-
-    if not results:
+    # Fetch price history for every symbol in one request
+    close = get_close_prices(download_history(symbols), symbols)
+    metrics = calculate_returns(close)
+
+    # A symbol can come back without prices because of a transient per-symbol
+    # error, so only suspect it here: its info lookup marks it dead if Yahoo
+    # confirms the symbol is unknown (skipped if the whole download failed)
+    counts = close.notna().sum()
+    if counts.any():
+        suspects = list(close.columns[counts == 0])
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            list(executor.map(get_stock_data, suspects))
+
+    found, info_columns = fetch_info_columns(list(metrics.index))
+    if not found.any():
         return pd.DataFrame()
 
-    df = pd.DataFrame(results)
+    columns = {
+        "symbol": metrics.index.to_numpy(dtype=object),
+        **info_columns,
+        **{name: metrics[name].to_numpy() for name in metrics.columns},
+    }
+    df = pd.DataFrame({name: values[found] for name, values in columns.items()})
+    df["categories"] = df["symbol"].map(SYMBOL_CATEGORIES)
+
+    df["value_score"], df["trend_score"] = calculate_scores(df)
+    df["combined_score"] = df["value_score"] + df["trend_score"]
 
     # Filter by minimum scores
-    df = df[(df["value_score"] >= min_value_score) & (df["trend_score"] >= min_trend_score)]
+    df = df.query("value_score >= @min_value_score and trend_score >= @min_trend_score")
+
+    # Select the top_k rows before sorting so only those need ordering
+    if top_k is not None and top_k < len(df):
+        top = np.argpartition(-df["combined_score"].to_numpy(), top_k)[:top_k]
+        df = df.iloc[top]
 
     # Sort by combined score (descending)
     df = df.sort_values("combined_score", ascending=False)
@@ -264,6 +582,11 @@ def screen_stocks(category: str = None, min_value_score: int = 5, min_trend_scor
     return df
 
 
+def _format_column(values: pd.Series, fmt: str, na: str = "N/A") -> pd.Series:
+    """Format a numeric column with a format string, showing missing values as na."""
+    return pd.to_numeric(values, errors="coerce").map(fmt.format, na_action="ignore").fillna(na)
+
+
 def display_results(df: pd.DataFrame):
     """Display screening results in a formatted table."""
     if df.empty:
@@ -278,12 +601,13 @@ def display_results(df: pd.DataFrame):
 
     # Format for display
     display_df = df[display_cols].copy()
-    display_df["price"] = display_df["price"].apply(lambda x: f"${x:.2f}")
-    display_df["pe_ratio"] = display_df["pe_ratio"].apply(lambda x: f"{x:.1f}" if pd.notna(x) else "N/A")
-    display_df["pb_ratio"] = display_df["pb_ratio"].apply(lambda x: f"{x:.2f}" if pd.notna(x) else "N/A")
-    display_df["dividend_yield"] = display_df["dividend_yield"].apply(lambda x: f"{x*100:.2f}%" if x else "0%")
-    display_df["beta"] = display_df["beta"].apply(lambda x: f"{x:.2f}" if pd.notna(x) else "N/A")
-    display_df["1y_return"] = display_df["1y_return"].apply(lambda x: f"{x:+.1f}%")
+    display_df["price"] = _format_column(display_df["price"], "${:.2f}")
+    display_df["pe_ratio"] = _format_column(display_df["pe_ratio"], "{:.1f}")
+    display_df["pb_ratio"] = _format_column(display_df["pb_ratio"], "{:.2f}")
+    div_yield = pd.to_numeric(display_df["dividend_yield"], errors="coerce").fillna(0)
+    display_df["dividend_yield"] = _format_column(div_yield * 100, "{:.2f}%").mask(div_yield == 0, "0%")
+    display_df["beta"] = _format_column(display_df["beta"], "{:.2f}")
+    display_df["1y_return"] = _format_column(display_df["1y_return"], "{:+.1f}%")
 
     print("\n" + "="*100)
     print("RECESSION-PROOF VALUE STOCKS - SCREENING RESULTS")